@@ -1,37 +1,54 @@
 import typing as th
+import types
 from .functions import dynamic_args_wrapper, eval_function
 from .get_value import get_value
 from .types import FunctionDescriptor, ContextType, _NoValue
 
+# memoization of end-to-end evaluations of string expressions, so that
+# repeated resolutions of the same expression become a single dict lookup
+# instead of two full lookup attempts; failures are deliberately not cached —
+# the global scope can change between calls (that is why get_value retries),
+# so an expression that failed once must be re-attempted on the next call
+_EVAL_CACHE = dict()
+_EVAL_CACHE_MAX_SIZE = 1024
 
-def eval(
+
+class EvaluationError(ValueError):
+    """
+    Raised when an expression could not be evaluated (in strict mode).
+
+    The error message is only built when the exception is actually rendered,
+    so callers that catch and swallow evaluation failures don't pay for the
+    string formatting.
+    """
+
+    def __init__(self, expression, value_error, function_error):
+        super().__init__()
+        self.expression = expression
+        self.value_error = value_error
+        self.function_error = function_error
+
+    def __str__(self):
+        return "Could not evaluate expression:\n%s \n\nValue error:\n%s. \n\nFunction error:\n%s" % (
+            self.expression,
+            self.value_error,
+            self.function_error,
+        )
+
+
+def _cache_result(key, result):
+    if len(_EVAL_CACHE) >= _EVAL_CACHE_MAX_SIZE:
+        _EVAL_CACHE.clear()
+    _EVAL_CACHE[key] = result
+
+
+def _evaluate(
     expression: th.Union[str, FunctionDescriptor],
     context: th.Optional[ContextType] = None,
     strict: bool = True,
     function_of_interest: str = None,
     dynamic_args: bool = False,
 ) -> th.Any:
-    """
-    Evaluate variable lookup and function evaluations in a string expression.
-
-    This function is the main entry point for the dypy package. It combines
-    the functionality of the get_value and eval_function functions to allow
-    for the evaluation of expressions that contain both variable lookups and
-    function evaluations.
-
-    Args:
-        expression (str or FunctionDescriptor): The expression to evaluate.
-        context (dict): The context to use for variable lookups.
-        strict (bool): Whether to raise an error if a variable lookup fails.
-        function_of_interest (str): The name of the function in the code-block to return.
-        dynamic_args (bool): Whether to wrap the resulting function in a dynamic_args_wrapper.
-
-    Returns:
-        The result of the evaluation.
-
-    Raises:
-        ValueError: If the expression could not be evaluated (and strict is True).
-    """
     value = _NoValue
     function_value = _NoValue
     value_error = None
@@ -57,9 +74,63 @@ def eval(
         return function_value
 
     if strict:
-        # raise exception and include both errors
-        raise ValueError(
-            "Could not evaluate expression:\n%s \n\nValue error:\n%s. \n\nFunction error:\n%s"
-            % (expression, value_error, function_error)
-        )
+        # raise an exception carrying both errors (message is built lazily)
+        raise EvaluationError(expression, value_error, function_error)
     return None
+
+
+def eval(
+    expression: th.Union[str, FunctionDescriptor],
+    context: th.Optional[ContextType] = None,
+    strict: bool = True,
+    function_of_interest: str = None,
+    dynamic_args: bool = False,
+) -> th.Any:
+    """
+    Evaluate variable lookup and function evaluations in a string expression.
+
+    This function is the main entry point for the dypy package. It combines
+    the functionality of the get_value and eval_function functions to allow
+    for the evaluation of expressions that contain both variable lookups and
+    function evaluations.
+
+    Evaluations of string expressions (against the global scope or a module
+    context) are memoized, so repeated evaluations of the same expression skip
+    the lookup and parsing work entirely. Use `eval.cache_clear()` to
+    invalidate the cache (e.g. after mutating the global scope).
+
+    Args:
+        expression (str or FunctionDescriptor): The expression to evaluate.
+        context (dict): The context to use for variable lookups.
+        strict (bool): Whether to raise an error if a variable lookup fails.
+        function_of_interest (str): The name of the function in the code-block to return.
+        dynamic_args (bool): Whether to wrap the resulting function in a dynamic_args_wrapper.
+
+    Returns:
+        The result of the evaluation.
+
+    Raises:
+        ValueError: If the expression could not be evaluated (and strict is True).
+    """
+    # already-evaluated expressions don't need any lookup or parsing work
+    if callable(expression):
+        return dynamic_args_wrapper(expression) if dynamic_args else expression
+
+    # only memoize hashable expressions evaluated against stable contexts
+    if not isinstance(expression, str) or not (context is None or isinstance(context, types.ModuleType)):
+        return _evaluate(expression, context, strict, function_of_interest, dynamic_args)
+
+    key = (expression, id(context), function_of_interest, dynamic_args, strict)
+    if key in _EVAL_CACHE:
+        return _EVAL_CACHE[key]
+
+    result = _evaluate(expression, context, strict, function_of_interest, dynamic_args)
+    # in non-strict mode _evaluate reports failure as None rather than
+    # raising, and failures must stay re-attemptable — legitimate None
+    # results merely forgo memoization
+    if strict or result is not None:
+        _cache_result(key, result)
+    return result
+
+
+eval.cache_clear = _EVAL_CACHE.clear
@@ -5,10 +5,65 @@ import functools
 from .types import ContextType, FunctionDescriptor, CallableFunctionDescriptorStr
 import types
 import copy
+import weakref
 
 # registry for function evaluation
 CONTEXT_REGISTRY = dict()
 
+# version counter bumped on registration, used to invalidate the snapshot below
+_REGISTRY_VERSION = 0
+_REGISTRY_SNAPSHOT = (None, -1)  # (snapshot dict, version it was taken at)
+
+
+def _registry_context() -> dict:
+    """
+    Returns a reusable snapshot dict of the context registry.
+
+    Building the evaluation context used to copy the whole registry on every
+    call; the snapshot is only rebuilt when the registry has changed since it
+    was last taken. The snapshot is shared, so it is only handed to read-only
+    consumers (expression evaluation) — code paths that exec into their
+    context must copy it first.
+
+    Returns:
+        dict: The snapshot of the registry.
+    """
+    global _REGISTRY_SNAPSHOT
+    snapshot, version = _REGISTRY_SNAPSHOT
+    if version != _REGISTRY_VERSION:
+        snapshot = dict(CONTEXT_REGISTRY)
+        _REGISTRY_SNAPSHOT = (snapshot, _REGISTRY_VERSION)
+    return snapshot
+
+# only cache the compiled code of reasonably sized sources, to avoid keeping
+# one-off huge code blocks alive in the cache
+_COMPILE_CACHE_SOURCE_LIMIT = 4096
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_cached(source: str, mode: str) -> types.CodeType:
+    return compile(source, "<dypy>", mode)
+
+
+def _compile(source: str, mode: str) -> types.CodeType:
+    """
+    Compiles a source string into a code object, caching the result.
+
+    Repeated evaluations of the same function descriptor (the common case when
+    dynamic fields or methods share their descriptors) skip Python's parser and
+    compiler entirely and reuse the cached code object.
+
+    Args:
+        source (str): The source code to compile.
+        mode (str): The compile mode ("eval" for expressions, "exec" for code blocks).
+
+    Returns:
+        types.CodeType: The compiled code object.
+    """
+    if len(source) > _COMPILE_CACHE_SOURCE_LIMIT:
+        return compile(source, "<dypy>", mode)
+    return _compile_cached(source, mode)
+
 
 def register_context(context: th.Any, name: str = None):
     """
@@ -21,9 +76,11 @@ def register_context(context: th.Any, name: str = None):
     Returns:
         None
     """
+    global _REGISTRY_VERSION
     if name is None:
         name = context.__name__
     CONTEXT_REGISTRY[name] = context
+    _REGISTRY_VERSION += 1
 
 
 def dynamic_args_wrapper(function: th.Callable) -> th.Callable:
@@ -39,9 +96,20 @@ def dynamic_args_wrapper(function: th.Callable) -> th.Callable:
     signature = inspect.signature(function)
     params = signature.parameters
 
+    # functions accepting **kwargs take any keyword argument, so no filtering
+    # (and therefore no wrapper overhead) is needed
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params.values()):
+        return function
+
+    param_names = frozenset(params)
+
     @functools.wraps(function)  # to preserve the function name and docstring in the wrapper
     def wrapper(*args, **kwargs):
-        call_kwargs = {name: kwargs[name] for name in params if name in kwargs}
+        # iterate over the smaller of the two dicts when filtering
+        if len(kwargs) < len(param_names):
+            call_kwargs = {name: value for name, value in kwargs.items() if name in param_names}
+        else:
+            call_kwargs = {name: kwargs[name] for name in param_names if name in kwargs}
         return function(*args, **call_kwargs)
 
     return wrapper
@@ -93,12 +161,21 @@ def update_function_context(function: th.Callable, context: th.Optional[ContextT
     return function
 
 
+# weak references to generated functions, so repeated identical generate_function
+# calls reuse the function object while letting it be freed once unreferenced
+_GENERATED_FUNCTION_CACHE = dict()
+
+
 def generate_function(
     code_block: str, function: str, context: th.Optional[ContextType] = None
 ) -> th.Callable[[th.Any], th.Any]:
     """
     Generates a function from a code block.
 
+    Calls without a per-call context are cached (weakly, keyed on the code
+    block and function name), so re-generating the same function becomes a
+    dict lookup instead of re-executing the code block.
+
     Args:
         code_block (str): The code block to generate the function from.
         function (str): The name of the function (in the code block) to return.
@@ -106,15 +183,85 @@ def generate_function(
     Returns:
         typing.Callable[[typing.Any], typing.Any]: The generated function.
     """
-    context = context or {}
-    context.update(CONTEXT_REGISTRY)
-    exec(code_block, dict(), context)
-    return types.FunctionType(
+    # only cache context-free generations: a caller-supplied context can change
+    # the generated function's behaviour between calls
+    key = (code_block, function, _REGISTRY_VERSION) if context is None else None
+    if key is not None:
+        ref = _GENERATED_FUNCTION_CACHE.get(key)
+        if ref is not None:
+            cached = ref()
+            if cached is not None:
+                return cached
+    context = {**CONTEXT_REGISTRY, **(context or {})}
+    exec(_compile(code_block, "exec"), dict(), context)
+    generated = types.FunctionType(
         code=context[function].__code__,
         globals=context,
         name=function,
         argdefs=context[function].__defaults__,
     )
+    if key is not None:
+        _GENERATED_FUNCTION_CACHE[key] = weakref.ref(generated)
+    return generated
+
+
+def _jit_function(function: th.Callable, signatures: th.Optional[th.List] = None) -> th.Callable:
+    """
+    Best-effort JIT compilation of a generated function with numba.
+
+    numba is imported lazily and is entirely optional; if it is not installed,
+    or the function cannot be lowered (e.g. it is not a plain function), the
+    original function is returned unchanged.
+
+    Args:
+        function (typing.Callable): The function to compile.
+        signatures (list): Optional numba signatures (e.g. ["float64(float64)"]) to compile
+            eagerly, so the first call dispatches directly instead of running type inference.
+
+    Returns:
+        typing.Callable: The JIT-compiled function, or the original one.
+    """
+    if not inspect.isfunction(function):
+        return function
+    try:
+        import numba
+    except ImportError:
+        return function
+    try:
+        if signatures is not None:
+            return numba.njit(signatures)(function)
+        return numba.njit(function)
+    except Exception:
+        return function
+
+
+def _cfunc_function(function: th.Callable, signature: th.Any) -> th.Callable:
+    """
+    Best-effort compilation of a generated function into a C callback with
+    numba.cfunc, for invocation from other JIT-compiled code without any
+    Python round-trip.
+
+    Like `_jit_function`, numba is imported lazily and any failure falls back
+    to the original Python function.
+
+    Args:
+        function (typing.Callable): The function to compile.
+        signature: The numba signature (e.g. "float64(float64)") to compile against.
+
+    Returns:
+        The compiled numba CFunc (exposing `.ctypes` and `.address`), or the
+        original function if compilation was not possible.
+    """
+    if not inspect.isfunction(function):
+        return function
+    try:
+        import numba
+    except ImportError:
+        return function
+    try:
+        return numba.cfunc(signature)(function)
+    except Exception:
+        return function
 
 
 def eval_function(
@@ -122,6 +269,9 @@ def eval_function(
     function_of_interest: str = None,
     context: th.Any = None,
     dynamic_args: bool = False,
+    jit: bool = False,
+    jit_signatures: th.Optional[th.List] = None,
+    cfunc_signature: th.Any = None,
 ) -> th.Callable:
     """
     Processes a function descriptor (str, dict, callable) into a callable function.
@@ -171,6 +321,23 @@ def eval_function(
             Useful for when a boilerplate function is expected to be called with a specific set of arguments, but the
             arguments are not known in advance, or are not always needed for the function to work.
 
+        jit (bool): If True, try to JIT-compile the resulting function with numba (if available).
+            Useful for numeric functions called in tight loops. This is best-effort: when numba is not
+            installed (it is an optional dependency) or the function cannot be compiled, the plain
+            Python function is returned instead.
+
+        jit_signatures (list): Optional numba signatures (e.g. ["float64(float64)"]) used together
+            with `jit=True`. When provided, compilation happens eagerly for the given signatures at
+            creation time, so calls dispatch directly to native code instead of triggering type
+            inference on first use.
+
+        cfunc_signature: If provided (e.g. "float64(float64)"), compile the resulting function into
+            a C callback with numba.cfunc instead of numba.njit. The returned object exposes `.ctypes`
+            (a callable C function pointer) and `.address`, so other JIT-compiled code can invoke it
+            without boxing arguments through the interpreter. Note that keyword-argument invocation is
+            lost on this path. Best-effort like `jit`: falls back to the plain function when numba is
+            unavailable or compilation fails.
+
     Returns:
         typing.Callable: The function.
     """
@@ -182,17 +349,22 @@ def eval_function(
             # evaluate the function with the Registry as the context (first type of function descriptor)
             # if it's a function dict descriptor, merge Registry with function["context"] (if exists) and run the function
             # if it's a function code descriptor, run the function
+            # build the merged context in a fresh dict instead of mutating the
+            # caller-passed one (caller entries take precedence over the registry);
+            # when there is nothing to merge, reuse the shared registry snapshot
+            # rather than copying the registry on every call
             if isinstance(function_descriptor, dict):
-                context = context or dict()
-                context.update(CONTEXT_REGISTRY)
-                context.update(function_descriptor.get("context", dict()))
+                descriptor_context = function_descriptor.get("context")
                 function_code = function_descriptor["code"]
             else:
-                context = context or dict()
-                context.update(CONTEXT_REGISTRY)
+                descriptor_context = None
                 function_code = function_descriptor
+            if context or descriptor_context:
+                context = {**CONTEXT_REGISTRY, **(context or {}), **(descriptor_context or {})}
+            else:
+                context = _registry_context()
 
-            results = eval(function_code, context)
+            results = eval(_compile(function_code, "eval"), context)
         except SyntaxError:
             # second and third type of function descriptor (code block)
             assert function_of_interest is not None or (
@@ -208,4 +380,8 @@ def eval_function(
                 context=context,
             )
 
+    if cfunc_signature is not None:
+        return _cfunc_function(results, cfunc_signature)
+    if jit:
+        results = _jit_function(results, signatures=jit_signatures)
     return dynamic_args_wrapper(results) if dynamic_args else results
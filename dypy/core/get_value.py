@@ -1,28 +1,43 @@
 import importlib
 import typing as th
+import functools
 import inspect
+import operator
 import os
-from .utils import is_module, is_package
+import sys
+from .utils import is_module, is_package, _split_dots
 from .types import ContextType, _NoValue
 
 
+@functools.lru_cache(maxsize=4096)
 def importer(name) -> ContextType:
     """
     Imports a module or a package.
     The difference between this function and importlib.import_module is that
     this function can import packages from the current working directory as well.
 
+    Results are cached (and already-imported modules are returned straight from
+    sys.modules), so repeated lookups of the same name skip the import machinery
+    and filesystem probes entirely. Use `importer.cache_clear()` after reloading
+    modules or changing the working directory.
+
     Args:
         name (str): The name of the module or package to import.
 
     Returns:
         types.ModuleType: The imported module or package.
     """
+    if name in sys.modules:
+        return sys.modules[name]
     try:
-        # try importing as a module (using importlib from standard import mechanism)
-        return __import__(name, globals=globals(), locals=locals())
+        # try importing as a module (using importlib from standard import mechanism);
+        # __import__ returns the top-level package for dotted names, so pick the
+        # leaf module out of sys.modules to match the fast path above — the cache
+        # would otherwise pin whichever of the two ran first
+        imported = __import__(name, globals=globals(), locals=locals())
+        return sys.modules.get(name, imported)
     except:
-        route_steps = name.split(".")
+        route_steps = _split_dots(name)
         route_steps = route_steps[1:] if not route_steps[0] else route_steps
         is_name_module, is_name_package = is_module(name), is_package(name)
         assert is_name_module or is_name_package
@@ -37,6 +52,20 @@ def importer(name) -> ContextType:
         return foo
 
 
+@functools.lru_cache(maxsize=4096)
+def _attrgetter(name: str) -> th.Callable:
+    """
+    Returns a (cached) operator.attrgetter for a dotted attribute chain.
+
+    Args:
+        name (str): The dotted attribute chain.
+
+    Returns:
+        typing.Callable: The attrgetter resolving the chain.
+    """
+    return operator.attrgetter(name)
+
+
 def greedy_import_context(name: str, upwards: bool = False, level: int = 0) -> th.Tuple[th.Any, str]:
     """
     Greediely try importing a name, and return the first successful import, and
@@ -52,7 +81,7 @@ def greedy_import_context(name: str, upwards: bool = False, level: int = 0) -> t
     Returns:
         th.Tuple[th.Any, str]: The first successful import, and the name of the variable we were able to lookup.
     """
-    module_hierarchy = name.split(".")
+    module_hierarchy = _split_dots(name)
     imported_module = _NoValue
     for trial_index in range(
         1 if upwards else len(module_hierarchy) - level,
@@ -79,7 +108,17 @@ def __get_value(name: str, strict: bool = True, upwards: bool = True, context: t
     """
 
     var, name = greedy_import_context(name, upwards=upwards) if context is None else (context, name)
-    for split in name.split(".") if name else []:
+    if name and "." not in name and not isinstance(var, dict):
+        # fast path: single-segment lookups on non-dict contexts are resolved
+        # by the C-level attrgetter, skipping the interpreter loop; dotted
+        # chains always go through the loop, because an intermediate dict must
+        # resolve by key before attribute access (e.g. a "keys" entry beats
+        # the dict.keys method), which attrgetter cannot honor
+        try:
+            return _attrgetter(name)(var)
+        except (AttributeError, TypeError):
+            pass
+    for split in _split_dots(name) if name else ():
         if isinstance(var, dict):
             if split not in var:
                 if strict:
@@ -99,38 +138,44 @@ def __get_value(name: str, strict: bool = True, upwards: bool = True, context: t
 
 def _get_value(name: str, prefer_modules: bool = False, strict: bool = True, context=None):
 
-    results = []
+    res_up = _NoValue
     try:
-        res = __get_value(name, upwards=True, strict=strict, context=context)
-        if res is not _NoValue:
-            results.append(res)
+        res_up = __get_value(name, upwards=True, strict=strict, context=context)
     except:
         pass
+
+    # the upwards result is what gets returned in the common case, so the second
+    # (downwards) walk is only needed when the first one failed, when modules are
+    # preferred over the first result, or when a non-strict lookup came back empty
+    if res_up is not _NoValue and not prefer_modules and not (not strict and res_up is None):
+        return res_up
+
+    res_down = _NoValue
     try:
-        res = __get_value(name, upwards=False, strict=strict, context=context)
-        if res is not _NoValue:
-            results.append(res)
+        res_down = __get_value(name, upwards=False, strict=strict, context=context)
     except:
         pass
 
-    if not results:
+    if res_up is _NoValue and res_down is _NoValue:
         if strict:
             raise ImportError("Could not find %s" % name)
         return None
-    if len(results) == 1:
-        return results[0]
+    if res_up is _NoValue:
+        return res_down
+    if res_down is _NoValue:
+        return res_up
 
     # checking for successful lookup in non-strict config (one of the two lookups succeeded)
-    if not strict and results[0] is None and results[1] is not None:
-        return results[1]
-    elif not strict and results[0] is not None and results[1] is None:
-        return results[0]
+    if not strict and res_up is None and res_down is not None:
+        return res_down
+    elif not strict and res_up is not None and res_down is None:
+        return res_up
 
     # looking for modules
     if prefer_modules:
-        return results[1] if inspect.ismodule(results[1]) else results[0]
+        return res_down if inspect.ismodule(res_down) else res_up
     else:
-        return results[0]
+        return res_up
 
 
 def get_value(
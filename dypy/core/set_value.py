@@ -1,5 +1,6 @@
 import typing as th
 from .get_value import greedy_import_context
+from .utils import _split_dots
 
 
 def set_value(name: str, value: th.Any, context: th.Optional[th.Any] = None):
@@ -14,7 +15,8 @@ def set_value(name: str, value: th.Any, context: th.Optional[th.Any] = None):
         None
     """
     var, name = greedy_import_context(name, upwards=True, level=1) if context is None else (context, name)
-    for split in name.split(".")[:-1] if name else []:
+    parent, _, leaf = name.rpartition(".")
+    for split in _split_dots(parent) if parent else ():
         if isinstance(var, dict):
             var = var[split]
         elif isinstance(var, list):
@@ -22,6 +24,6 @@ def set_value(name: str, value: th.Any, context: th.Optional[th.Any] = None):
         else:
             var = getattr(var, split)
     if isinstance(var, dict):
-        var[name.split(".")[-1]] = value
+        var[leaf] = value
     else:
-        setattr(var, name.split(".")[-1], value)
+        setattr(var, leaf, value)
@@ -1,7 +1,47 @@
+import functools
 import os
 import typing as th
 
 
+@functools.lru_cache(maxsize=4096)
+def _split_dots(name: str) -> th.Tuple[str, ...]:
+    """
+    Splits a dotted name into its parts once and caches the result.
+
+    The dotted names flowing through get_value/set_value come from a small,
+    bounded vocabulary (module paths and field descriptors), and the hot paths
+    re-split the same strings on every lookup; sharing one immutable tuple per
+    name avoids the repeated list allocations.
+
+    Args:
+        name (str): The dotted name to split.
+
+    Returns:
+        tuple: The parts of the name.
+    """
+    return tuple(name.split("."))
+
+
+@functools.lru_cache(maxsize=256)
+def _dir_entries(path: str) -> th.FrozenSet[str]:
+    """
+    Lists the entries of a directory once and caches them, so repeated module
+    and package probes against the same directory become set lookups instead of
+    one filesystem stat per probe. Use `_dir_entries.cache_clear()` when files
+    are created at runtime or the working directory changes.
+
+    Args:
+        path (str): The directory to list.
+
+    Returns:
+        frozenset: The entry names of the directory (empty if it does not exist).
+    """
+    try:
+        return frozenset(os.listdir(path or "."))
+    except OSError:
+        return frozenset()
+
+
 def is_module(name: str) -> bool:
     """
     Check wether a name is a module in the current working directory.
@@ -12,9 +52,10 @@ def is_module(name: str) -> bool:
     Returns:
         bool: True if the name is a module, False otherwise.
     """
-    route_steps = name.split(".")
+    route_steps = _split_dots(name)
     route_steps = route_steps[1:] if not route_steps[0] else route_steps  # .modulename.<...>
-    return os.path.exists(os.path.join(*route_steps[:-1], f"{route_steps[-1]}.py"))
+    parent = os.path.join(*route_steps[:-1]) if len(route_steps) > 1 else "."
+    return f"{route_steps[-1]}.py" in _dir_entries(parent)
 
 
 def is_package(name: str) -> bool:
@@ -27,6 +68,6 @@ def is_package(name: str) -> bool:
     Returns:
         bool: True if the name is a package, False otherwise.
     """
-    route_steps = name.split(".")
+    route_steps = _split_dots(name)
     route_steps = route_steps[1:] if not route_steps[0] else route_steps  # .modulename.<...>
-    return os.path.exists(os.path.join(*route_steps, "__init__.py"))
+    return "__init__.py" in _dir_entries(os.path.join(*route_steps))
@@ -1,18 +1,156 @@
 import typing as th
 import sys
+import hashlib
 import inspect
 import abc
+import os
+import pickle
+import weakref
 from ..core.get_value import get_value as original_get_value
 from ..core.types import ContextType
-from .utils import make_inheritence_strict
+from .utils import make_inheritence_strict, _get_class_globals
 import warnings
 
 _FIELDS = "__dypy_fields__"
+_FIELD_NAMES = "__dypy_field_names__"
+_FIELD_DEFAULTS = "__dypy_field_defaults__"
 _DY_TYPE_SUFFIX = "_type"
 _DY_CONSTRUCTOR_ARGS_SUFFIX = "_args"
 
+# opt-in cross-process cache of resolved (eval=True) field defaults: when this
+# environment variable points to a directory, defaults resolved at decoration
+# time are pickled there so subsequent interpreter starts skip the get_value
+# walk for unchanged classes (the cache key includes the source mtime)
+_FIELDS_CACHE_DIR = os.environ.get("DYPY_FIELDS_CACHE_DIR")
+
+
+def _persisted_defaults_path(cls: type, prefixed_fields: list) -> th.Optional[str]:
+    if not _FIELDS_CACHE_DIR:
+        return None
+    module = sys.modules.get(cls.__module__)
+    source = getattr(module, "__file__", None) if module is not None else None
+    try:
+        mtime = os.path.getmtime(source) if source else 0
+    except OSError:
+        mtime = 0
+    spec = repr(
+        sorted(
+            (name, str(val._value), val.eval, val.prefer_modules, val.strict)
+            for name, _, val in prefixed_fields
+        )
+    )
+    digest = hashlib.sha1(f"{cls.__module__}.{cls.__qualname__}:{mtime}:{spec}".encode()).hexdigest()
+    return os.path.join(_FIELDS_CACHE_DIR, f"{digest}.pkl")
+
+
+def _load_persisted_defaults(path: th.Optional[str]) -> th.Optional[dict]:
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except Exception:
+        # missing, stale, or no-longer-unpicklable cache: fall through to the
+        # regular resolution path
+        return None
+
+
+def _store_persisted_defaults(path: th.Optional[str], defaults: dict):
+    if path is None or not defaults:
+        return
+    try:
+        os.makedirs(_FIELDS_CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as cache_file:
+            pickle.dump(defaults, cache_file)
+    except Exception:
+        # non-picklable defaults or an unwritable cache dir simply disable
+        # persistence for this class
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# set this to False to skip the DynamicField-as-value deprecation warnings
+# entirely: warnings.warn walks the stack and matches filters even when the
+# warning ends up suppressed, which is measurable in tight construction loops
+SHOW_DEPRECATION_WARNINGS = True
+
+# sentinel marking a not-yet-resolved (or invalidated) evaluated field value
+_UNRESOLVED = object()
+
+# sentinel for absent instance attributes in snapshot comparisons
+_MISSING = object()
+
+# composite classes resolved at instantiation time, keyed by descriptor and
+# context identity; values are held weakly so cached classes stay collectable
+_RESOLVED_CLASS_CACHE: "weakref.WeakValueDictionary[tuple, type]" = weakref.WeakValueDictionary()
+
+
+def _resolve_composite_class(class_name, context) -> type:
+    """
+    Resolves (and caches) the class a composite override names, so repeated
+    construction with the same override skips the get_value walk.
+    """
+    cache_key = (class_name, id(context))
+    resolved = _RESOLVED_CLASS_CACHE.get(cache_key)
+    if resolved is None:
+        resolved = original_get_value(class_name, False, True, context)
+        _RESOLVED_CLASS_CACHE[cache_key] = resolved
+    return resolved
+
+
+# merged parent field maps, keyed weakly by class, so re-decorating a class
+# (or decorating it through several wrappers) walks its reversed MRO once
+_MERGED_BASE_FIELDS: "weakref.WeakKeyDictionary[type, dict]" = weakref.WeakKeyDictionary()
+
+
+def _merged_base_fields(cls: type) -> dict:
+    """
+    Collects the dynamic fields inherited by `cls` in a single reversed-MRO
+    walk. The first definition seen wins, matching the original per-base
+    merge order. Results are cached per class (weakly, so classes stay
+    collectable).
+    """
+    merged = _MERGED_BASE_FIELDS.get(cls)
+    if merged is None:
+        # read each base's own __dict__ directly: decorated classes store
+        # their (already merged) map there, and skipping getattr avoids both
+        # the MRO re-resolution and counting inherited maps twice
+        base_maps = []
+        for b in cls.__mro__[-1:0:-1]:
+            base_fields = b.__dict__.get(_FIELDS)
+            if base_fields is not None:
+                base_maps.append(base_fields)
+        if len(base_maps) == 1:
+            # single decorated ancestor: share its map as-is (callers copy
+            # before mutating)
+            merged = base_maps[0]
+        else:
+            merged = {}
+            for base_fields in base_maps:
+                for f in base_fields:
+                    if f not in merged:
+                        merged[f] = base_fields[f]
+        _MERGED_BASE_FIELDS[cls] = merged
+    return merged
+
 
 class DynamicField:
+    # fixed layout: drops the per-instance __dict__ and speeds attribute
+    # access for the field objects every decorated class keeps around
+    __slots__ = (
+        "nullable",
+        "strict",
+        "prefer_modules",
+        "eval",
+        "context",
+        "is_class",
+        "constructor_arguments",
+        "_value",
+        "_resolved",
+    )
+
     def __init__(
         self,
         value,
@@ -40,21 +178,40 @@ class DynamicField:
 
         self.constructor_arguments = constructor_arguments or {}
         self._value = value
+        self._resolved = _UNRESOLVED
+
+    def invalidate(self):
+        """
+        Drops a previously resolved value so that the next access to `value`
+        re-runs the lookup; call this after mutating the lookup context (or
+        anything it resolves through) in place.
+        """
+        self._resolved = _UNRESOLVED
 
     def change_context(self, context: th.Optional[ContextType] = None):
         # TODO: might not be the best way to go
         if self.context is None:
             self.context = context
+            # the context taking part in the lookup changed, so any previously
+            # resolved value is stale
+            self.invalidate()
 
     @property
     def value(self):
-        return (
-            self._value
-            if not self.eval
-            else original_get_value(
+        if not self.eval:
+            return self._value
+        # resolve the lookup once and keep the result; failed lookups are not
+        # cached and will be retried on the next access — that includes the
+        # None a non-strict lookup returns instead of raising, so the field
+        # re-resolves once its context gains the name
+        if self._resolved is _UNRESOLVED:
+            resolved = original_get_value(
                 self._value, self.prefer_modules, self.strict, self.context
             )
-        )
+            if resolved is None and not self.strict:
+                return None
+            self._resolved = resolved
+        return self._resolved
 
     def get_instance(self):
         if not self.is_class:
@@ -113,11 +270,189 @@ def get_dynamic_value(self, key: str, default: th.Any = None) -> th.Any:
         The value of the dynamic field
     """
     cls = self.__class__
-    if key not in getattr(cls, _FIELDS, {}):
+    # membership against the frozenset frozen at decoration time, and a plain
+    # __dict__ lookup instead of the descriptor protocol
+    if key not in cls.__dypy_field_names__:
+        raise AttributeError(f"{key} is not a dynamic field of {cls.__name__}")
+    return self.__dict__.get(key, default)
+
+
+def _get_dynamic_value_slotted(self, key: str, default: th.Any = None) -> th.Any:
+    """
+    get_dynamic_value for decorated classes whose instances carry no
+    __dict__ (__slots__): same membership check, but the value is read back
+    through getattr so slot descriptors resolve.
+    """
+    cls = self.__class__
+    if key not in cls.__dypy_field_names__:
         raise AttributeError(f"{key} is not a dynamic field of {cls.__name__}")
     return getattr(self, key, default)
 
 
+def _pick_get_dynamic_value(cls: type) -> th.Callable:
+    # the plain-__dict__ form only works for instances that have one
+    return get_dynamic_value if getattr(cls, "__dictoffset__", 0) != 0 else _get_dynamic_value_slotted
+
+
+_OBJECT_SETATTR = object.__setattr__
+
+
+def _any_data_descriptor(cls: type, names) -> bool:
+    """
+    Reports whether any of `names` resolves to a data descriptor (property,
+    slot, ...) somewhere in the MRO of `cls`. Such names must go through
+    setattr — a raw __dict__ write would silently bypass the descriptor (and
+    swallow e.g. the AttributeError of a read-only property).
+    """
+    for name in names:
+        for base in cls.__mro__:
+            descriptor = base.__dict__.get(name)
+            if descriptor is not None:
+                descriptor_type = type(descriptor)
+                if hasattr(descriptor_type, "__set__") or hasattr(descriptor_type, "__delete__"):
+                    return True
+                break
+    return False
+
+
+def _make_set_defaults(field_defaults: tuple, bulk: bool = False) -> th.Callable:
+    """
+    Builds a per-class function writing every dynamic-field default onto an
+    instance. When `bulk` is allowed (plain attribute protocol, instances
+    carry a __dict__), the defaults land in a single C-level dict update;
+    otherwise the function is exec-generated as a flat sequence of attribute
+    stores with the defaults bound as locals of the generated namespace. Both
+    replace the dict-iteration-plus-setattr loop that ran (twice) on every
+    instantiation.
+    """
+    if bulk:
+        defaults = dict(field_defaults)
+
+        def _set_defaults(self):
+            # subclasses may override __setattr__ without re-decorating, so
+            # the bulk update is guarded by one pointer comparison
+            if type(self).__setattr__ is _OBJECT_SETATTR:
+                self.__dict__.update(defaults)
+            else:
+                for name, default in field_defaults:
+                    setattr(self, name, default)
+
+        return _set_defaults
+
+    namespace = {f"_default_{index}": default for index, (_, default) in enumerate(field_defaults)}
+    lines = [f"    self.{name} = _default_{index}" for index, (name, _) in enumerate(field_defaults)]
+    source = "def _set_defaults(self):\n" + ("\n".join(lines) if lines else "    pass")
+    exec(compile(source, "<dypy.field_wrapper>", "exec"), namespace)
+    return namespace["_set_defaults"]
+
+
+# Signature and Parameter objects are immutable, so extended __init__ signatures
+# can be shared between classes with the same original init and field layout
+_SIGNATURE_CACHE = dict()
+
+# the (self, /) portion of object.__init__, so the C-level init never needs to
+# be introspected with inspect.Signature.from_callable
+_OBJECT_INIT_PARAMETERS = (inspect.Parameter("self", inspect.Parameter.POSITIONAL_ONLY),)
+
+
+def _extend_init_signature(prev_init: th.Callable, dynamic_fields: dict) -> inspect.Signature:
+    """
+    Builds the signature of the repurposed init function: the signature of
+    `prev_init` extended with one keyword-only parameter per dynamic field
+    (with the field default and annotation), minus *args/**kwargs.
+
+    Results are cached per (init, field layout), so decorating many classes
+    sharing the same init and fields reuses the same Signature object.
+    """
+    # annotations and defaults may be unhashable (lists, dicts), so the key
+    # uses their ids — and the cache entry must then keep the keyed objects
+    # alive, or a garbage-collected init/annotation could see its id reused
+    # by a different object with a matching field layout
+    cache_key = (
+        id(prev_init),
+        tuple((name, id(spec[0]), id(spec[1])) for name, spec in dynamic_fields.items()),
+    )
+    cached = _SIGNATURE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached[0]
+
+    if prev_init is object.__init__:
+        all_parameters = list(_OBJECT_INIT_PARAMETERS)
+        return_annotation = inspect.Signature.empty
+    else:
+        sig = inspect.Signature.from_callable(prev_init)
+        all_parameters = list(sig.parameters.values())
+        return_annotation = sig.return_annotation
+
+    # membership is tracked by parameter name (inherited inits may already
+    # expose some of the fields), avoiding a linear Parameter-equality scan
+    # per field
+    existing_names = {p.name for p in all_parameters}
+    for name, (annotation, default) in dynamic_fields.items():
+        if name in existing_names:
+            continue
+        existing_names.add(name)
+        all_parameters.append(
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=default,
+                annotation=annotation,
+            )
+        )
+
+    # delete *args and **kwargs from all_parameters
+    all_parameters = [
+        p
+        for p in all_parameters
+        if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+
+    signature = inspect.Signature(all_parameters, return_annotation=return_annotation)
+    _SIGNATURE_CACHE[cache_key] = (signature, prev_init, tuple(dynamic_fields.values()))
+    return signature
+
+
+class _LazySignature:
+    """
+    Defers building the extended init signature until something actually
+    introspects the class — instantiation never pays for it.
+
+    inspect.signature returns a callable's `__signature__` attribute directly
+    when one is present, so the descriptor lives on the class: on first
+    access it builds the full signature, publishes it on the init function
+    (where `inspect.signature(cls.__init__)` expects it), and caches the
+    self-stripped variant on the accessed class so later reads are plain
+    attribute lookups.
+    """
+
+    __slots__ = ("prev_init", "builder", "new_init")
+
+    def __init__(self, prev_init, builder, new_init):
+        self.prev_init = prev_init
+        self.builder = builder
+        self.new_init = new_init
+
+    def materialize(self, objtype: th.Optional[type] = None) -> inspect.Signature:
+        # an already-decorated parent (or stacked wrapper) may have deferred
+        # its own signature; publish it first so it can be extended here
+        lazy_prev = getattr(self.prev_init, "__dypy_lazy_signature__", None)
+        if lazy_prev is not None:
+            lazy_prev.materialize()
+        full = self.builder()
+        self.new_init.__signature__ = full
+        stripped = full.replace(parameters=list(full.parameters.values())[1:])
+        if objtype is not None:
+            try:
+                objtype.__signature__ = stripped
+            except (AttributeError, TypeError):
+                pass
+        return stripped
+
+    def __get__(self, obj, objtype=None):
+        return self.materialize(objtype)
+
+
 def _dynamize_fields(
     cls: type, indicator_prefix: th.Optional[str], inheritence_strict: bool = True
 ) -> type:
@@ -128,245 +463,283 @@ def _dynamize_fields(
     indicator_prefix = indicator_prefix or ""
     full_indicator_prefix = f"{indicator_prefix}"
 
-    # A list of all the dynamic fields of the class
-    # (key, value) : key is considered without the indicator prefix
-    dynamic_fields = {}
-
-    # Taken from dataclass code
-    if cls.__module__ in sys.modules:
-        globals = sys.modules[cls.__module__].__dict__
-    else:
-        # Theoretically this can happen if someone writes
-        # a custom string to cls.__module__.  In which case
-        # such dataclass won't be fully introspectable
-        # (w.r.t. typing.get_type_hints) but will still function
-        # correctly.
-        globals = {}
+    # Taken from dataclass code (resolved once per module, see _get_class_globals)
+    globals = _get_class_globals(cls)
 
     # create a dictionary where dynamic_fields[name] is mapped to (annotation, default)
-    dynamic_fields = {}
-
-    # Find our base classes in reverse MRO order, and exclude
-    # ourselves.  In reversed order so that more derived classes
-    # override earlier field definitions in base classes.
-    has_dataclass_bases = False
-    for b in cls.__mro__[-1:0:-1]:
-        # Only process classes that have been processed by our
-        # decorator.  That is, they have a _FIELDS attribute.
-        base_fields = getattr(b, _FIELDS, None)
-        if base_fields is not None:
-            has_dataclass_bases = True
-            for f in base_fields:
-                # If the base class field is already defined in the
-                # subclass, we'll override it.
-                if f not in dynamic_fields:
-                    dynamic_fields[f] = base_fields[f]
+    # seeded with the fields inherited from already-decorated base classes
+    # (a single cached reversed-MRO walk, see _merged_base_fields)
+    dynamic_fields = dict(_merged_base_fields(cls))
 
     # Now find fields in the class that start with the indicator_prefix
     # and exclude that prefix and put it in dynamic_fields
+    # (collected in a single pass so they can be batch-deleted afterwards)
     cls_annotations = cls.__dict__.get("__annotations__", {})
-    for name, val in cls.__dict__.items():
-        if isinstance(val, DynamicField) and name.startswith(full_indicator_prefix):
-
-            if val is None:
-                raise AttributeError(
-                    f"Field {name} should have an initial default value"
-                )
-
-            if val.context:
-                raise NotImplementedError(
-                    "Context merging is not yet implemented in the field wrapper"
-                )
-
-            # Change the context to the class context
-            # TODO: optimally, one should merge the context of the class and the field
-            val.change_context(globals)
-
-            # get the value in the field
-            actual_name = name[len(full_indicator_prefix) :]
-
-            annotation = cls_annotations.get(name, None)
-
-            if val.is_class:
-                if annotation is not None:
-                    raise TypeError("Should not set annotation for class objects")
-                dynamic_fields[actual_name] = (
-                    val,
-                    val.get_instance(),
-                )
-
-                dynamic_fields[f"{actual_name}{_DY_TYPE_SUFFIX}"] = (str, val._value)
-                dynamic_fields[f"{actual_name}{_DY_CONSTRUCTOR_ARGS_SUFFIX}"] = (
-                    dict,
-                    val.constructor_arguments,
-                )
+    prefixed_fields = [
+        (name, name[len(full_indicator_prefix) :], val)
+        for name, val in cls.__dict__.items()
+        if isinstance(val, DynamicField) and name.startswith(full_indicator_prefix)
+    ]
+
+    # optional cross-process cache of resolved eval-field defaults
+    cache_path = _persisted_defaults_path(cls, prefixed_fields)
+    persisted_defaults = _load_persisted_defaults(cache_path)
+    resolved_defaults = {}
+
+    for name, actual_name, val in prefixed_fields:
+
+        if val.context:
+            raise NotImplementedError(
+                "Context merging is not yet implemented in the field wrapper"
+            )
+
+        # Change the context to the class context
+        # TODO: optimally, one should merge the context of the class and the field
+        val.change_context(globals)
+
+        annotation = cls_annotations.get(name, None)
+
+        if val.is_class:
+            if annotation is not None:
+                raise TypeError("Should not set annotation for class objects")
+            dynamic_fields[actual_name] = (
+                val,
+                val.get_instance(),
+            )
+
+            dynamic_fields[f"{actual_name}{_DY_TYPE_SUFFIX}"] = (str, val._value)
+            dynamic_fields[f"{actual_name}{_DY_CONSTRUCTOR_ARGS_SUFFIX}"] = (
+                dict,
+                val.constructor_arguments,
+            )
+        else:
+            if persisted_defaults is not None and actual_name in persisted_defaults:
+                default = persisted_defaults[actual_name]
             else:
-                dynamic_fields[actual_name] = (annotation or type(val.value), val.value)
+                default = val.value
+                if val.eval:
+                    resolved_defaults[actual_name] = default
+            dynamic_fields[actual_name] = (annotation or type(default), default)
+
+    _store_persisted_defaults(cache_path, resolved_defaults)
 
     # Remove all the fields starting with the indicator_prefix
     # from the class dictionary so that it can work seamlessly with other libraries
-
-    for name in dynamic_fields.keys():
-        if getattr(cls, full_indicator_prefix + name, None) is not None:
-            delattr(cls, full_indicator_prefix + name)
-            if (
-                "__annotations__" in cls.__dict__
-                and indicator_prefix + name in cls.__dict__["__annotations__"]
-            ):
-                cls.__dict__["__annotations__"].pop(indicator_prefix + name)
-
-    # Add the dynamic_fields to the class dictionary
+    # (one batched pass over the attributes collected above, and a single
+    # rebuild of __annotations__ instead of per-field pops)
+    for prefixed_name, _, _ in prefixed_fields:
+        delattr(cls, prefixed_name)
+    if prefixed_fields and "__annotations__" in cls.__dict__:
+        prefixed_names = {prefixed_name for prefixed_name, _, _ in prefixed_fields}
+        cls.__annotations__ = {
+            name: annotation
+            for name, annotation in cls_annotations.items()
+            if name not in prefixed_names
+        }
+
+    # Add the dynamic_fields to the class dictionary as decoration-time
+    # metadata (annotations, field specs), along with the structures the hot
+    # paths actually consume: a frozenset of the field names for membership
+    # tests and a flat (name, default) tuple for iteration (both captured by
+    # the init wrapper below)
+    field_names = frozenset(dynamic_fields)
+    field_defaults = tuple((name, spec[1]) for name, spec in dynamic_fields.items())
     setattr(cls, _FIELDS, dynamic_fields)
+    setattr(cls, _FIELD_NAMES, field_names)
+    setattr(cls, _FIELD_DEFAULTS, field_defaults)
+
+    # nothing to wrap (defensive decoration, or strictness-only use): skip the
+    # init repurposing and all deferred signature machinery
+    if not dynamic_fields:
+        setattr(cls, "get_dynamic_value", _pick_get_dynamic_value(cls))
+        if inheritence_strict and not getattr(cls, "__final__", False):
+            cls = make_inheritence_strict(cls, _FIELDS)
+        return cls
+
+    # decide the composite-vs-scalar branch for every field name once: names
+    # carrying constructor-args dicts map to their base name, and composite
+    # scalar names are the ones with such a companion entry
+    composite_args_names = {
+        name: name[: -len(_DY_CONSTRUCTOR_ARGS_SUFFIX)]
+        for name in dynamic_fields
+        if name.endswith(_DY_CONSTRUCTOR_ARGS_SUFFIX)
+    }
+    composite_scalar_names = frozenset(
+        name for name in dynamic_fields if f"{name}{_DY_CONSTRUCTOR_ARGS_SUFFIX}" in field_names
+    )
+    # and the ready-made "<name>_args" key per composite, so the override loop
+    # never concatenates strings at runtime
+    composite_args_keys = {
+        base_name: args_name for args_name, base_name in composite_args_names.items()
+    }
 
     # repurpose the init function so that one can pass in the dynamic field values
     # as keyword arguments
     prev_init = cls.__init__
-    # 1. define a signature-less init function
-    def new_init(self, *args, **kwargs):
-        del_from_kwargs = []
-
-        for name, value in kwargs.items():
-            if name in dynamic_fields:
-                del_from_kwargs.append((name, value))
 
-        for name, _ in del_from_kwargs:
-            kwargs.pop(name)
-
-        def set_all_values():
-            # set the default values of the dynamic fields
-            for name, value in getattr(self.__class__, _FIELDS, {}).items():
-                setattr(self, name, value[1])
-
-            # write stuff that has been inputted in the init function
-            names_with_dict = set()
-            for name, value in del_from_kwargs:
-
-                # works with both DynamicField and the actual value
-                if isinstance(value, DynamicField):
-                    # give a warning if the value is of DynamicField type
+    # 1. specialize the per-instance defaults pass for this class (a flat
+    # exec-generated sequence of attribute stores instead of a dict-driven
+    # loop — the same codegen trick dataclasses uses for __init__)
+    set_defaults = _make_set_defaults(
+        field_defaults,
+        # one C-level dict update beats per-attribute stores, but only for
+        # instances with a plain attribute protocol and a __dict__, and only
+        # when no field name shadows an inherited data descriptor (those must
+        # go through setattr, matching the override path)
+        bulk=cls.__setattr__ is object.__setattr__
+        and getattr(cls, "__dictoffset__", 0) != 0
+        and not _any_data_descriptor(cls, field_names),
+    )
 
+    # 2. the slow path applying user-supplied values (including deprecated
+    # DynamicField values and composite overrides) on top of the defaults
+    def apply_overrides(self, overrides):
+        # write stuff that has been inputted in the init function
+        names_with_dict = set()
+        for name, value in overrides.items():
+
+            # works with both DynamicField and the actual value (an identity
+            # check: subclasses of DynamicField are not supported here, which
+            # keeps the per-kwarg test a single pointer comparison)
+            if value.__class__ is DynamicField:
+                # give a warning if the value is of DynamicField type
+                if SHOW_DEPRECATION_WARNINGS:
                     warnings.warn(
                         f"Passing a DynamicField object as a value to {name} is deprecated. "
                         f"Please use the value of the DynamicField object instead.",
                         DeprecationWarning,
                     )
 
-                    if value.is_class:
-                        value.change_context(globals)
-                        setattr(self, name, value.get_instance())
-                    else:
-                        setattr(self, name, value.value)
+                if value.is_class:
+                    value.change_context(globals)
+                    setattr(self, name, value.get_instance())
                 else:
-                    if name + _DY_CONSTRUCTOR_ARGS_SUFFIX in getattr(
-                        self.__class__, _FIELDS, {}
-                    ) or name.endswith(_DY_CONSTRUCTOR_ARGS_SUFFIX):
-                        # This is the name of a composite so handle composites
-                        # handle construction
-                        # TODO: implement this better
-                        _name = (
-                            name
-                            if not name.endswith(_DY_CONSTRUCTOR_ARGS_SUFFIX)
-                            else name[: -len(_DY_CONSTRUCTOR_ARGS_SUFFIX)]
-                        )
-                        names_with_dict.add(_name)
-                    else:
-                        setattr(self, name, value)
-
-            del_from_kwargs_dict = dict(del_from_kwargs)
-
-            # write the dynamic class values
-            for name in names_with_dict:
-
-                val = getattr(self.__class__, _FIELDS, {}).get(name, (None, None))[0]
-
-                class_name = (
-                    val._value
-                    if name not in del_from_kwargs_dict
-                    else del_from_kwargs_dict[name]
-                )
-                class_args = (
-                    val.constructor_arguments
-                    if name + _DY_CONSTRUCTOR_ARGS_SUFFIX not in del_from_kwargs_dict
-                    else del_from_kwargs_dict[name + _DY_CONSTRUCTOR_ARGS_SUFFIX]
-                )
-
-                if class_name is None:
-                    if val.nullable:
-                        setattr(self, name, None)
-                        continue
-                    else:
-                        raise TypeError(
-                            f"Field {name} is not nullable but None given in constructor"
-                        )
-
-                # get the default constructor args
-
-                if val and val._value == class_name:
-                    constructor_args = val.constructor_arguments
-                    # overwrite class_args with original
-                    for k, v in class_args.items():
-                        constructor_args[k] = v
-                elif val:
-                    constructor_args = class_args
-
-                val = DynamicField(
-                    class_name,
-                    is_class=True,
-                    context=globals,
-                    constructor_arguments=constructor_args,
-                )
-                val.change_context(globals)
-                setattr(self, name, val.get_instance())
-
-        # First set all values for potential usage in the __init__
-        set_all_values()
-        # init should return None by convention
-        ret = prev_init(self, *args, **kwargs)
-        # TODO: check for changes: if something has been changed in the init function
-        # then raise an error
-
-        # Then re-write all the values in the __init__
-        set_all_values()
-
-        return ret
-
-    # 2. set the signature of the init function
-    sig = inspect.Signature.from_callable(prev_init)
-
-    all_parameters = list(sig.parameters.values())
-    for name in dynamic_fields.keys():
-        new_param = inspect.Parameter(
-            name,
-            inspect.Parameter.KEYWORD_ONLY,
-            default=dynamic_fields[name][1],
-            annotation=dynamic_fields[name][0],
-        )
-        if new_param not in all_parameters:
-            all_parameters.append(new_param)
+                    # skip the property dispatch for plain (non-eval) fields
+                    setattr(self, name, value.value if value.eval else value._value)
+            else:
+                # composite handling, with the branch decision precomputed at
+                # decoration time as two set/dict membership tests
+                if name in composite_args_names:
+                    names_with_dict.add(composite_args_names[name])
+                elif name in composite_scalar_names:
+                    names_with_dict.add(name)
+                else:
+                    setattr(self, name, value)
 
-    # delete *args and **kwargs from all_parameters
-    all_parameters = [
-        p for p in all_parameters if p.kind != inspect.Parameter.VAR_POSITIONAL
-    ]
+        # write the dynamic class values
+        for name in names_with_dict:
 
-    all_parameters = [
-        p for p in all_parameters if p.kind != inspect.Parameter.VAR_KEYWORD
-    ]
+            val = dynamic_fields.get(name, (None, None))[0]
+
+            class_name = (
+                val._value if name not in overrides else overrides[name]
+            )
+            args_key = composite_args_keys.get(name)
+            class_args = (
+                overrides[args_key]
+                if args_key in overrides
+                else val.constructor_arguments
+            )
+
+            if class_name is None:
+                if val.nullable:
+                    setattr(self, name, None)
+                    continue
+                else:
+                    raise TypeError(
+                        f"Field {name} is not nullable but None given in constructor"
+                    )
+
+            # get the default constructor args
+
+            if val and val._value == class_name:
+                # merge the user overrides over a copy of the decoration-time
+                # defaults; writing into the shared default dict would leak
+                # one instance's overrides into every later construction
+                constructor_args = {**val.constructor_arguments, **class_args}
+            elif val:
+                constructor_args = class_args
+
+            # resolve and instantiate the composite class directly, without
+            # building a throwaway DynamicField around it
+            setattr(
+                self,
+                name,
+                _resolve_composite_class(class_name, globals)(**constructor_args),
+            )
+
+    # 3. define a signature-less init function; the double defaults/overrides
+    # pass exists so that a user __init__ can observe the values and still be
+    # overridden afterwards — when there is no user __init__ to call, a single
+    # pass suffices
+    if prev_init is object.__init__:
+
+        def new_init(self, *args, **kwargs):
+            # C-level set intersection with the kwargs keyview; empty (and
+            # effectively free) when no field kwargs were passed
+            overrides = {name: kwargs.pop(name) for name in field_names.intersection(kwargs)}
+
+            set_defaults(self)
+            if overrides:
+                apply_overrides(self, overrides)
+            # let object.__init__ raise on unexpected leftover arguments
+            return object.__init__(self, *args, **kwargs)
+
+    else:
 
-    new_init.__signature__ = inspect.Signature(
-        all_parameters, return_annotation=sig.return_annotation
+        def new_init(self, *args, **kwargs):
+            # C-level set intersection with the kwargs keyview; empty (and
+            # effectively free) when no field kwargs were passed
+            overrides = {name: kwargs.pop(name) for name in field_names.intersection(kwargs)}
+
+            # First set all values for potential usage in the __init__
+            set_defaults(self)
+            if overrides:
+                apply_overrides(self, overrides)
+            snapshot = [(name, getattr(self, name, _MISSING)) for name in field_names]
+            # init should return None by convention
+            ret = prev_init(self, *args, **kwargs)
+            # TODO: check for changes: if something has been changed in the init function
+            # then raise an error
+
+            # The field values take precedence over whatever the original init
+            # wrote, but the re-write (including composite re-instantiation) is
+            # only needed if the init actually touched a dynamic field
+            for name, value in snapshot:
+                if getattr(self, name, _MISSING) is not value:
+                    set_defaults(self)
+                    if overrides:
+                        apply_overrides(self, overrides)
+                    break
+
+            return ret
+
+    # expose the building blocks of the init wrapper so full_wrapper can fuse
+    # the field and method passes into one frame (see full_wrapper._fuse_inits)
+    new_init.__dypy_field_init_parts__ = (field_names, set_defaults, apply_overrides, prev_init)
+
+    # 4. defer building the extended signature to the first introspection of
+    # the class; most production code never reads it
+    lazy_signature = _LazySignature(
+        prev_init,
+        lambda: _extend_init_signature(prev_init, dynamic_fields),
+        new_init,
     )
+    new_init.__dypy_lazy_signature__ = lazy_signature
+    cls.__signature__ = lazy_signature
 
-    # 3. set the new init function
+    # 5. set the new init function
     cls.__init__ = new_init
 
     # Now implement the getvalue method
-    setattr(cls, "get_dynamic_value", get_dynamic_value)
+    setattr(cls, "get_dynamic_value", _pick_get_dynamic_value(cls))
 
     # abc.update_abstractmethods(cls) # todo: handle lower python versions
 
-    if inheritence_strict:
-        # make the class inheritence strict so that every child class should have the _FIELDS attribute
+    if inheritence_strict and not getattr(cls, "__final__", False):
+        # make the class inheritence strict so that every child class should have
+        # the _FIELDS attribute; @typing.final classes cannot be subclassed
+        # anyway, so they skip the subclass hook entirely
         cls = make_inheritence_strict(cls, _FIELDS)
 
     return cls
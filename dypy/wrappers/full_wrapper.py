@@ -1,7 +1,73 @@
-from .field_wrapper import _dynamize_fields
-from .method_wrapper import _dynamize_methods
+from .field_wrapper import _dynamize_fields, _MISSING
+from .method_wrapper import _dynamize_methods, _implement
 import typing as th
 
+
+def _fuse_inits(cls: type) -> type:
+    """
+    Replaces the stacked field/method init wrappers with one fused init, so a
+    fully dynamized class pays for a single extra Python frame per
+    instantiation instead of one per wrapper. Behavior is identical: dynamic
+    methods are implemented first, then the field defaults/overrides passes
+    run around the original init exactly as the individual wrappers do.
+    """
+    method_init = cls.__dict__.get("__init__")
+    method_parts = getattr(method_init, "__dypy_method_init_parts__", None)
+    if method_parts is None:
+        return cls
+    method_dispatch, method_globals, field_init = method_parts
+    field_parts = getattr(field_init, "__dypy_field_init_parts__", None)
+    if field_parts is None:
+        return cls
+    field_names, set_defaults, apply_overrides, prev_init = field_parts
+    trivial_init = prev_init is object.__init__
+
+    def fused_init(self, *args, **kwargs):
+        # Implement the methods that are passed as keyword arguments
+        delete_from_kwargs = []
+        for name in kwargs:
+            key_name = method_dispatch.get(name)
+            if key_name is not None:
+                _implement(self, key_name, kwargs[name], context=method_globals)
+                delete_from_kwargs.append(name)
+        for name in delete_from_kwargs:
+            kwargs.pop(name)
+
+        # C-level set intersection with the kwargs keyview; empty (and
+        # effectively free) when no field kwargs were passed
+        overrides = {name: kwargs.pop(name) for name in field_names.intersection(kwargs)}
+
+        # First set all values for potential usage in the __init__
+        set_defaults(self)
+        if overrides:
+            apply_overrides(self, overrides)
+        if trivial_init:
+            # let object.__init__ raise on unexpected leftover arguments
+            return object.__init__(self, *args, **kwargs)
+        snapshot = [(name, getattr(self, name, _MISSING)) for name in field_names]
+        ret = prev_init(self, *args, **kwargs)
+        # The field values take precedence over whatever the original init
+        # wrote, but the re-write (including composite re-instantiation) is
+        # only needed if the init actually touched a dynamic field
+        for name, value in snapshot:
+            if getattr(self, name, _MISSING) is not value:
+                set_defaults(self)
+                if overrides:
+                    apply_overrides(self, overrides)
+                break
+        return ret
+
+    # retarget the deferred signature so it publishes onto the fused init
+    lazy_signature = getattr(method_init, "__dypy_lazy_signature__", None)
+    if lazy_signature is not None:
+        lazy_signature.new_init = fused_init
+        fused_init.__dypy_lazy_signature__ = lazy_signature
+    else:
+        fused_init.__signature__ = method_init.__signature__
+    cls.__init__ = fused_init
+    return cls
+
+
 # Merge the signature of all the wrappers into one signature that acts upon the class
 def _dynamize(
     cls,
@@ -18,7 +84,7 @@ def _dynamize(
     ret_cls = _dynamize_methods(
         ret_cls, inheritence_strict=inheritence_strict, blend=blend
     )
-    return ret_cls
+    return _fuse_inits(ret_cls)
 
 
 def dynamize(
@@ -2,13 +2,40 @@ import typing as th
 import types
 import sys
 import inspect
+import functools
+import weakref
 from ..core.types import FunctionDescriptor
 from ..core.functions import eval_function
 import abc
-from ..wrappers.utils import make_inheritence_strict
+from ..wrappers.utils import make_inheritence_strict, _get_class_globals
+from .field_wrapper import _LazySignature
 
 PREF_FOR_CONSTRUCTOR = "__dy__"
 
+# merged parent method sets, keyed weakly by class, so re-decorating a class
+# (or decorating it through several wrappers) walks its reversed MRO once
+_MERGED_BASE_METHODS: "weakref.WeakKeyDictionary[type, tuple]" = weakref.WeakKeyDictionary()
+
+
+def _merged_base_methods(cls: type) -> th.Tuple[frozenset, frozenset]:
+    """
+    Collects the (dynamic, blended) method names inherited by `cls` in a
+    single reversed-MRO walk, cached per class (weakly, so classes stay
+    collectable).
+    """
+    merged = _MERGED_BASE_METHODS.get(cls)
+    if merged is None:
+        # read each base's own __dict__ directly; decorated classes store
+        # their (already merged) sets there
+        dynamic_methods = set()
+        blended_dynamic_methods = set()
+        for b in cls.__mro__[-1:0:-1]:
+            dynamic_methods |= b.__dict__.get("__dynamic_methods__", frozenset())
+            blended_dynamic_methods |= b.__dict__.get("__blended_dynamic_methods__", frozenset())
+        merged = (frozenset(dynamic_methods), frozenset(blended_dynamic_methods))
+        _MERGED_BASE_METHODS[cls] = merged
+    return merged
+
 
 def dynamic_method(func: th.Callable, blend: th.Optional[bool] = None) -> th.Callable:
     """
@@ -35,6 +62,58 @@ def dynamic_method(func: th.Callable, blend: th.Optional[bool] = None) -> th.Cal
     return func
 
 
+# compiled dynamic-method implementations, keyed by descriptor, interest,
+# context identity and dynamic_args, so constructing many instances from the
+# same spec (factory patterns) compiles the descriptor once; only string
+# descriptors are cached (callables pass through eval_function untouched and
+# non-string descriptors may be unhashable). The tradeoff: a cached function
+# keeps the globals it was compiled against, so instances built after a
+# module-level name changes still see the old value — call
+# implement_method.cache_clear() after mutating a context a descriptor
+# resolves through
+_IMPLEMENTATION_CACHE = dict()
+_IMPLEMENTATION_CACHE_MAX_SIZE = 1024
+
+
+def _implement(
+    self,
+    method_name: str,
+    function_descriptor: FunctionDescriptor,
+    function_of_interest: str = None,
+    context: th.Any = None,
+    dynamic_args: bool = False,
+):
+    # compile-and-bind without membership validation, for callers whose
+    # dispatch tables already guarantee method_name is a dynamic method
+    if isinstance(function_descriptor, str):
+        cache_key = (function_descriptor, function_of_interest, id(context), dynamic_args)
+        entry = _IMPLEMENTATION_CACHE.get(cache_key)
+        if entry is None:
+            fn = eval_function(
+                function_descriptor,
+                function_of_interest,
+                context,
+                dynamic_args,
+            )
+            if len(_IMPLEMENTATION_CACHE) >= _IMPLEMENTATION_CACHE_MAX_SIZE:
+                _IMPLEMENTATION_CACHE.clear()
+            # the key holds only the context's id, so the entry pins the
+            # context itself — a collected context could otherwise see its id
+            # reused and hand back a function compiled against the dead one
+            _IMPLEMENTATION_CACHE[cache_key] = (fn, context)
+        else:
+            fn = entry[0]
+    else:
+        fn = eval_function(
+            function_descriptor,
+            function_of_interest,
+            context,
+            dynamic_args,
+        )
+
+    setattr(self, method_name, types.MethodType(fn, self))
+
+
 def implement_method(
     self,
     method_name: str,
@@ -47,14 +126,17 @@ def implement_method(
     if method_name not in cls.__dynamic_methods__:
         raise AttributeError(f"{method_name} is not a dynamic method of {cls.__name__}")
 
-    fn = eval_function(
+    _implement(
+        self,
+        method_name,
         function_descriptor,
         function_of_interest,
         context,
         dynamic_args,
     )
 
-    setattr(self, method_name, types.MethodType(fn, self))
+
+implement_method.cache_clear = _IMPLEMENTATION_CACHE.clear
 
 
 def implement_methods(self, **kwargs):
@@ -62,6 +144,113 @@ def implement_methods(self, **kwargs):
         implement_method(self, method_name, method_code)
 
 
+# extended __init__ signatures are immutable, so they are shared between
+# classes with the same original init and dynamic-method layout
+_SIGNATURE_CACHE = dict()
+
+# the (self, /) portion of object.__init__, so the C-level init never needs to
+# be introspected with inspect.Signature.from_callable
+_OBJECT_INIT_PARAMETERS = (inspect.Parameter("self", inspect.Parameter.POSITIONAL_ONLY),)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_param(name: str, default: th.Any) -> inspect.Parameter:
+    """
+    Returns a (cached) keyword-only FunctionDescriptor parameter. Parameter
+    objects are immutable, and every dynamic-method parameter differs only by
+    name and default, so classes sharing method names share the objects too.
+    """
+    return inspect.Parameter(
+        name,
+        inspect.Parameter.KEYWORD_ONLY,
+        default=default,
+        annotation=th.Optional[FunctionDescriptor],
+    )
+
+
+def _init_parameter_names(init_before: th.Callable) -> frozenset:
+    """
+    Returns the declared parameter names of `init_before` (minus *args and
+    **kwargs) straight from its code object, so clashes can be checked at
+    decoration time without building an inspect.Signature. Inits without a
+    code object (object.__init__) and the generated (self, *args, **kwargs)
+    wrappers of inherited decorated inits report no real parameters — the
+    full signature build still guards those when something introspects the
+    class.
+    """
+    code = getattr(init_before, "__code__", None)
+    if code is None:
+        return frozenset()
+    return frozenset(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount])
+
+
+def _extend_init_signature(
+    init_before: th.Callable,
+    dynamic_methods: th.FrozenSet[str],
+    blended_dynamic_methods: th.FrozenSet[str],
+) -> inspect.Signature:
+    """
+    Builds the signature of the repurposed init function: the signature of
+    `init_before` extended with one keyword-only parameter per dynamic method
+    (both `__dy__`-prefixed and blended names), minus *args/**kwargs.
+
+    Results are cached per (init, method layout), so decorating many classes
+    sharing the same init and dynamic methods reuses the same Signature object.
+    """
+    # key on the init function itself (not its id): the cache retains entries
+    # forever, and keying on id alone would let a garbage-collected init's id
+    # be reused by a different function with the same method layout
+    cache_key = (init_before, dynamic_methods, blended_dynamic_methods)
+    cached = _SIGNATURE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if init_before is object.__init__:
+        all_parameters = list(_OBJECT_INIT_PARAMETERS)
+        return_annotation = inspect.Signature.empty
+    else:
+        sig = inspect.Signature.from_callable(init_before)
+        all_parameters = list(sig.parameters.values())
+        return_annotation = sig.return_annotation
+
+    # membership is tracked by parameter name (inherited, already-extended
+    # inits may expose some of these parameters), avoiding a linear
+    # Parameter-equality scan per method
+    existing = {p.name: p for p in all_parameters}
+
+    # add all the __dy__ prefixed parameters to the signature
+    for name in dynamic_methods:
+        new_param = _make_param(f"{PREF_FOR_CONSTRUCTOR}{name}", None)
+        if new_param.name not in existing:
+            existing[new_param.name] = new_param
+            all_parameters.append(new_param)
+
+    # add all the non prefixed parameters to the signature that are blended
+    for name in blended_dynamic_methods:
+        new_param = _make_param(name, inspect.Parameter.empty)
+        previous = existing.get(name)
+        if previous is None:
+            existing[name] = new_param
+            all_parameters.append(new_param)
+        elif previous != new_param:
+            # an equal parameter just means the method was already blended into
+            # an inherited init; anything else is a genuine name clash
+            raise Exception(
+                f"Cannot blend dynamic method with attribute of the same name: {name}\nConsider changing the method name!"
+            )
+
+    # delete *args and **kwargs from all_parameters (TODO: not sure of this)
+    all_parameters = [
+        p
+        for p in all_parameters
+        if p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+
+    signature = inspect.Signature(all_parameters, return_annotation=return_annotation)
+    _SIGNATURE_CACHE[cache_key] = signature
+    return signature
+
+
 def _dynamize_methods(cls: type, inheritence_strict: bool, blend: bool) -> type:
     """
     This function is a class decorator that wraps the class with a class wrapper.
@@ -84,15 +273,8 @@ def _dynamize_methods(cls: type, inheritence_strict: bool, blend: bool) -> type:
         The wrapped class
     """
     # Heavily influenced by dataclasses code
-    if cls.__module__ in sys.modules:
-        globals = sys.modules[cls.__module__].__dict__
-    else:
-        # Theoretically this can happen if someone writes
-        # a custom string to cls.__module__.  In which case
-        # such dataclass won't be fully introspectable
-        # (w.r.t. typing.get_type_hints) but will still function
-        # correctly.
-        globals = {}
+    # (resolved once per module, see _get_class_globals)
+    globals = _get_class_globals(cls)
 
     # get allthe methods that are tagged with __is_dynamic_method__ and
     # add them to the class attribute __dynamic_methods__
@@ -100,33 +282,33 @@ def _dynamize_methods(cls: type, inheritence_strict: bool, blend: bool) -> type:
     # decorator, then add it to the __blended_dynamic_methods__ set and if it was specifically
     # set to not blend, then do not add it to the set
     # otherwise, check out the blend option of the class decorator
+    # walk the MRO __dict__s directly instead of dir(cls) + getattr: dir()
+    # sorts and deduplicates the whole attribute space, and getattr runs the
+    # descriptor protocol (firing properties) for every name
     dynamic_methods = set()
     blended_dynamic_methods = set()
-    for name in dir(cls):
-        value = getattr(cls, name)
-        if getattr(value, "__is_dynamic_method__", False):
-            dynamic_methods.add(name)
-
-            # handle blending
-            blend_spec = getattr(value, "__blend__", None)
-            if blend_spec is None:
-                blend_spec = blend
-
-            # if it was blended specifically or blended in options add the name
-            if blend_spec:
-                blended_dynamic_methods.add(name)
+    seen = set()
+    for base in cls.__mro__:
+        for name, value in base.__dict__.items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if getattr(value, "__is_dynamic_method__", False):
+                dynamic_methods.add(name)
+
+                # handle blending
+                blend_spec = getattr(value, "__blend__", None)
+                if blend_spec is None:
+                    blend_spec = blend
+
+                # if it was blended specifically or blended in options add the name
+                if blend_spec:
+                    blended_dynamic_methods.add(name)
     # handle inheritence, merge the dynamic methods of the parent classes
-    for b in cls.__mro__[-1:0:-1]:
-        # merge dynamic methods with parent
-        dynamic_methods = dynamic_methods.union(
-            getattr(b, "__dynamic_methods__", set())
-        )
-        # merge blended dynamic methods with parent
-        blended_dynamic_methods = blended_dynamic_methods.union(
-            getattr(b, "__blended_dynamic_methods__", set())
-        )
-    cls.__dynamic_methods__ = frozenset(dynamic_methods)
-    cls.__blended_dynamic_methods__ = frozenset(blended_dynamic_methods)
+    # (a single cached reversed-MRO walk, see _merged_base_methods)
+    base_dynamic, base_blended = _merged_base_methods(cls)
+    cls.__dynamic_methods__ = frozenset(dynamic_methods) | base_dynamic
+    cls.__blended_dynamic_methods__ = frozenset(blended_dynamic_methods) | base_blended
 
     # add the implement_methods method to the class
     setattr(cls, "implement_methods", implement_methods)
@@ -134,6 +316,16 @@ def _dynamize_methods(cls: type, inheritence_strict: bool, blend: bool) -> type:
     # 2. Define the new __init__ function for the new class
     init_before = cls.__init__
 
+    # map every accepted constructor kwarg (both the __dy__-prefixed and the
+    # blended spellings) to its method name once at decoration time, so the
+    # init wrapper does a single dict lookup per kwarg instead of prefix
+    # stripping and two set-membership tests
+    method_dispatch = {}
+    for name in cls.__dynamic_methods__:
+        method_dispatch[f"{PREF_FOR_CONSTRUCTOR}{name}"] = name
+    for name in cls.__blended_dynamic_methods__:
+        method_dispatch[name] = name
+
     # First define the new __init__ function without signature
     # and then add the signature
     def new_init(self, *args, **kwargs):
@@ -141,17 +333,10 @@ def _dynamize_methods(cls: type, inheritence_strict: bool, blend: bool) -> type:
         # Implement the methods that are passed as keyword arguments
         delete_from_kwargs = []
         for name in kwargs:
-            key_name = name
-            if name.startswith(PREF_FOR_CONSTRUCTOR):
-                # check if name starts with __dy__
-                key_name = name[len(PREF_FOR_CONSTRUCTOR) :]
-            else:
-                if key_name not in cls.__blended_dynamic_methods__:
-                    key_name = None
-
-            if key_name in cls.__dynamic_methods__:
+            key_name = method_dispatch.get(name)
+            if key_name is not None:
                 # TODO: check whether there are any other context arguments
-                implement_method(self, key_name, kwargs[name], context=globals)
+                _implement(self, key_name, kwargs[name], context=globals)
                 delete_from_kwargs.append(name)
 
         # Delete the arguments that were used to implement the methods
@@ -161,58 +346,42 @@ def _dynamize_methods(cls: type, inheritence_strict: bool, blend: bool) -> type:
         # call the parent __init__ method
         return init_before(self, *args, **kwargs)
 
-    # Extend the signature of init_before to include implementations of
-    # the dynamic methods and assign the new signature to the new __init__
-    sig = inspect.Signature.from_callable(init_before)
-    all_parameters = list(sig.parameters.values())
-    # add all the __dy__ prefixed parameters to the signature
-    for name in cls.__dynamic_methods__:
-        new_param = inspect.Parameter(
-            f"{PREF_FOR_CONSTRUCTOR}{name}",
-            inspect.Parameter.KEYWORD_ONLY,
-            default=None,
-            annotation=th.Optional[FunctionDescriptor],
-        )
-        if new_param not in all_parameters:
-            all_parameters.append(new_param)
-        # all_parameters[f"{PREF_FOR_CONSTRUCTOR}{name}"] = new_param
-
-    # add all the non prefixed parameters to the signature that are blended
-    for name in cls.__blended_dynamic_methods__:
-        if name in all_parameters:
-            raise Exception(
-                f"Cannot blend dynamic method with attribute of the same name: {name}\nConsider changing the method name!"
-            )
-        new_param = inspect.Parameter(
-            name,
-            inspect.Parameter.KEYWORD_ONLY,
-            default=inspect.Parameter.empty,
-            annotation=th.Optional[FunctionDescriptor],
+    # expose the building blocks of the init wrapper so full_wrapper can fuse
+    # the field and method passes into one frame (see full_wrapper._fuse_inits)
+    new_init.__dypy_method_init_parts__ = (method_dispatch, globals, init_before)
+
+    # Defer extending init_before's signature with the dynamic methods to the
+    # first introspection of the class, exactly like the field wrapper; the
+    # descriptor also materializes a deferred stacked/inherited signature
+    # before extending it, and overwrites any field-stage descriptor on cls
+    all_dynamic_methods = cls.__dynamic_methods__
+    all_blended_methods = cls.__blended_dynamic_methods__
+    # the name-clash check must not be deferred along with the signature:
+    # a blended method shadowing a real init parameter would otherwise
+    # decorate and instantiate cleanly (the kwarg silently routed to
+    # _implement) and only blow up on introspection
+    clashes = all_blended_methods & _init_parameter_names(init_before)
+    if clashes:
+        raise Exception(
+            f"Cannot blend dynamic method with attribute of the same name: {sorted(clashes)[0]}\nConsider changing the method name!"
         )
-        if new_param not in all_parameters:
-            all_parameters.append(new_param)
-
-    # delete *args and **kwargs from all_parameters (TODO: not sure of this)
-    all_parameters = [
-        p for p in all_parameters if p.kind != inspect.Parameter.VAR_POSITIONAL
-    ]
-
-    all_parameters = [
-        p for p in all_parameters if p.kind != inspect.Parameter.VAR_KEYWORD
-    ]
-    # replace the parameters with the extended version
-    new_init.__signature__ = inspect.Signature(
-        all_parameters, return_annotation=sig.return_annotation
+    lazy_signature = _LazySignature(
+        init_before,
+        lambda: _extend_init_signature(init_before, all_dynamic_methods, all_blended_methods),
+        new_init,
     )
+    new_init.__dypy_lazy_signature__ = lazy_signature
+    cls.__signature__ = lazy_signature
 
     # finally, setup as the new init function
     cls.__init__ = new_init
 
     # abc.update_abstractmethods(cls) # todo: support lower python versions
 
-    if inheritence_strict:
+    if inheritence_strict and not getattr(cls, "__final__", False):
         # if inheritence is set to strict then all the children of this class should also contain
-        # the dynamic methods
+        # the dynamic methods; @typing.final classes cannot be subclassed anyway,
+        # so they skip the subclass hook entirely
         cls = make_inheritence_strict(cls, "__dynamic_methods__")
 
     return cls
@@ -1,25 +1,82 @@
-import functools
+import sys
+
+# module namespaces resolved for decorated classes, keyed by module name, so
+# stacking the field and method wrappers on one class resolves its module once
+_MOD_GLOBALS_CACHE = dict()
+
+
+def _get_class_globals(cls: type) -> dict:
+    """
+    Returns the namespace of the module defining `cls` (dataclasses-style:
+    an empty dict if someone wrote a custom string to cls.__module__, in
+    which case the class is less introspectable but still functional).
+    """
+    module_name = cls.__module__
+    module_globals = _MOD_GLOBALS_CACHE.get(module_name)
+    if module_globals is None:
+        if module_name in sys.modules:
+            module_globals = sys.modules[module_name].__dict__
+            _MOD_GLOBALS_CACHE[module_name] = module_globals
+        else:
+            # unknown modules are not cached, in case they get imported later
+            module_globals = {}
+    return module_globals
 
 
 def make_inheritence_strict(cls: type, attribute_to_check: str):
-    # when instantiating a class that inherits cls and the __init__ method is called
-    # then the super() is called which redirects to the __init__ of the parent class
-    # here, we should check if the child class is also decorated with @dynamize or not
+    # when instantiating a class that inherits cls, the child class should also
+    # be decorated with @dynamize. The decorator only runs after the class body
+    # has been executed, so the child cannot be validated at class-creation
+    # time directly -- instead, subclass creation installs a checking __init__
+    # on the subclass that validates it at instantiation. The decorated class
+    # itself no longer pays a per-instantiation check.
+
+    error_message = (
+        f"{cls.__name__} is a strict class and can only be inherited by classes with the same criteria:"
+        "\ntry decorating the child class with @dypy.wrappers such as @dypy.wrappers.dynamize"
+    )
+
+    # the checking init is exec-generated with the attribute name baked in as a
+    # literal, so the check costs one dict membership test and no closure-cell
+    # dereferences
+    check_init_source = compile(
+        f"def new_init(self, *args, **kwargs):\n"
+        f"    # Check if the class is itself decorated with @dynamize or not\n"
+        f"    if {attribute_to_check!r} not in self.__class__.__dict__:\n"
+        f"        raise AttributeError(_error_message)\n"
+        f"    return _old_init(self, *args, **kwargs)\n",
+        "<dypy.wrappers.utils>",
+        "exec",
+    )
+
+    # chain to whatever hook the class already carries in its own __dict__ (a
+    # user-defined __init_subclass__, or the checker installed by another
+    # strict wrapper in the stack) instead of silently replacing it: stacked
+    # strict wrappers must enforce all their attributes, and user hooks must
+    # keep firing
+    previous_hook = cls.__dict__.get("__init_subclass__")
+
+    def __init_subclass__(sub, **kwargs):
+        if previous_hook is not None:
+            getattr(previous_hook, "__func__", previous_hook)(sub, **kwargs)
+        else:
+            super(cls, sub).__init_subclass__(**kwargs)
+
+        old_init = sub.__init__
 
-    old_init = cls.__init__
+        namespace = {"_old_init": old_init, "_error_message": error_message}
+        exec(check_init_source, namespace)
+        new_init = namespace["new_init"]
 
-    # keep signature
-    @functools.wraps(old_init)
-    def new_init(self, *args, **kwargs):
+        # keep the wrapped init introspectable without the functools.wraps
+        # attribute-copying machinery
+        new_init.__name__ = "__init__"
+        new_init.__qualname__ = f"{sub.__qualname__}.__init__"
+        new_init.__doc__ = old_init.__doc__
+        new_init.__wrapped__ = old_init
 
-        # Check if the class is itself decorated with @dynamize or not
-        if attribute_to_check not in self.__class__.__dict__:
-            raise AttributeError(
-                f"{cls.__name__} is a strict class and can only be inherited by classes with the same criteria:"
-                "\ntry decorating the child class with @dypy.wrappers such as @dypy.wrappers.dynamize"
-            )
-        return old_init(self, *args, **kwargs)
+        sub.__init__ = new_init
 
-    cls.__init__ = new_init
+    cls.__init_subclass__ = classmethod(__init_subclass__)
 
     return cls
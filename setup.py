@@ -1,11 +1,25 @@
+import compileall
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 from dypy import __version__
 
 with open("README.md", encoding="utf-8") as f:
     long_description = f.read()
 
+
+class build_py_compiled(build_py):
+    """Byte-compile the package during the build so that the first import
+    after installation loads cached .pyc files instead of parsing sources."""
+
+    def run(self):
+        build_py.run(self)
+        compileall.compile_dir(self.build_lib, quiet=1, force=True)
+
+
 setup(
     name="dypy",
+    cmdclass={"build_py": build_py_compiled},
     packages=find_packages(include=["dypy", "dypy.*"]),
     version=__version__,
     license="MIT",